@@ -1,13 +1,32 @@
 import asyncio
 import sys
 import time
-from collections.abc import Generator
+from collections.abc import Coroutine, Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from bot import EcoCordClient, TestEcoCordClient
 from ecosystem import EcosystemManager
 
+# uvloop is only installed on Linux and macOS; fall back to the default asyncio event loop without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run_async(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, on a uvloop event loop when uvloop is installed.
+
+    Args:
+    ----
+        coro (Coroutine[Any, Any, None]): The coroutine to run.
+
+    """
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    asyncio.run(coro, loop_factory=loop_factory)
+
 
 async def run_discord_bot(test_mode: bool = True) -> None:
     """Run the Discord bot in either test or production mode.
@@ -21,7 +40,6 @@ async def run_discord_bot(test_mode: bool = True) -> None:
         Exception: Any unhandled exception during bot execution.
 
     """
-    loop = asyncio.get_event_loop()
     client = TestEcoCordClient() if test_mode else EcoCordClient()
 
     try:
@@ -34,7 +52,6 @@ async def run_discord_bot(test_mode: bool = True) -> None:
         print("Cleaning up...")
         await client.stop_all_ecosystems()
         await client.close()
-        await loop.shutdown_asyncgens()
 
 
 def run_gif_generator(duration: float | None = None) -> Generator[tuple[str, float], None, None]:
@@ -52,13 +69,12 @@ def run_gif_generator(duration: float | None = None) -> Generator[tuple[str, flo
     manager = EcosystemManager(generate_gifs=True)
     manager.start(show_controls=False)
 
-    start_time = time.time()
+    deadline = None if duration is None else time.monotonic() + duration
     try:
-        while duration is None or time.time() - start_time < duration:
-            gif_data = manager.get_latest_gif()
+        while deadline is None or (remaining := deadline - time.monotonic()) > 0:
+            gif_data = manager.get_latest_gif(timeout=None if deadline is None else remaining)
             if gif_data:
                 yield gif_data
-            time.sleep(0.01)
     finally:
         manager.stop()
 
@@ -84,7 +100,7 @@ def run_pygame(show_controls: bool = True, generate_gifs: bool = False) -> Ecosy
 def main() -> None:
     """Run the main Discord bot in production mode."""
     print("Running with Discord integration...")
-    asyncio.run(run_discord_bot(test_mode=False))
+    run_async(run_discord_bot(test_mode=False))
 
 
 def main_interactive() -> None:
@@ -92,8 +108,10 @@ def main_interactive() -> None:
     print("Running in interactive mode...")
     manager = run_pygame(show_controls=True, generate_gifs=False)
     try:
-        while True:
-            pass
+        # Wait for the simulation process to exit, e.g. when its window is closed; the timeout keeps
+        # KeyboardInterrupt responsive on platforms where an untimed wait cannot be interrupted
+        while manager.process.is_alive():
+            manager.process.join(timeout=1)
     except KeyboardInterrupt:
         manager.stop()
 
@@ -101,7 +119,7 @@ def main_interactive() -> None:
 def main_discord_test() -> None:
     """Run the Discord bot in test mode."""
     print("[Test mode] Running with fake Discord integration...")
-    asyncio.run(run_discord_bot(test_mode=True))
+    run_async(run_discord_bot(test_mode=True))
 
 
 def main_gifs() -> None:
@@ -1,18 +1,248 @@
 import math
 import random
 
+import numpy as np
 import pygame
-from pygame import Surface, Vector2
+from pygame import Vector2
 
-from ecosystem.critter import Critter
+from ecosystem.critter import BlitSequence, Critter, circle_stencil, premultiplied_surface
+
+# Wing angles, in degrees, over one flap cycle; indexed by the flap phase instead of calling sin per bird
+_WING_ANGLE_STEPS = 1024
+_WING_ANGLES = np.sin(np.linspace(0, 2 * math.pi, _WING_ANGLE_STEPS, endpoint=False)) * 45
+
+
+def _wing_angle(ticks: int, wing_speed: np.ndarray) -> np.ndarray:
+    """Look up the wing angles of a flock of birds at the given time.
+
+    Args:
+    ----
+        ticks (int): The current time, in milliseconds.
+        wing_speed (np.ndarray): The flapping speed of each bird, in radians per second.
+
+    Returns:
+    -------
+        np.ndarray: The wing angles, in degrees.
+
+    """
+    phase = wing_speed * (ticks * 0.001 * _WING_ANGLE_STEPS / (2 * math.pi))
+    return _WING_ANGLES[phase.astype(np.int64) & (_WING_ANGLE_STEPS - 1)]
+
+
+# Overlays are cached per quantized wing angle, in degrees, and per quantized heading. The beak tip sits up to
+# about 33 pixels from the centre, so 256 heading steps move it by at most 0.4 pixels, which together with
+# snapping the overlays to the nearest pixel keeps every drawn pixel within one pixel of exact drawing.
+# A bird only keeps the beaks for its most recent headings, so its cache stays small however much it turns
+_WING_ANGLE_QUANTUM = 2
+_HEADING_STEPS = 256
+_MAX_BEAK_OVERLAYS = 32
+
+
+def _overlay_canvas(points: list[tuple[float, float]]) -> tuple[pygame.Surface, int, int]:
+    """Create a transparent surface just large enough to hold the given points.
+
+    Args:
+    ----
+        points (list[tuple[float, float]]): The points to fit, relative to the centre of a bird.
+
+    Returns:
+    -------
+        tuple[pygame.Surface, int, int]: The surface and the offset of its top-left corner from the bird's centre.
+
+    """
+    left = math.floor(min(x for x, _ in points)) - 1
+    top = math.floor(min(y for _, y in points)) - 1
+    width = math.ceil(max(x for x, _ in points)) - left + 2
+    height = math.ceil(max(y for _, y in points)) - top + 2
+    return pygame.Surface((width, height), pygame.SRCALPHA), left, top
+
+
+class _FlockField:
+    """Exposes a bird's entry in one of its flock's state arrays as an attribute.
+
+    Vector fields such as position and velocity read as read-only NumPy views, so modifying one in place
+    (``bird.position[0] = ...``) raises instead of silently changing a copy; assign the whole value instead.
+    A view is only valid until the bird's flock gains or loses a bird.
+    """
+
+    def __init__(self, array: str, column: int | None = None) -> None:
+        self.array = array
+        self.column = column
+
+    def __get__(self, bird: "Bird | None", owner: type | None = None) -> "np.ndarray | float | bool | _FlockField":
+        if bird is None:
+            return self
+        value = getattr(bird.flock, self.array)[bird.index]
+        if self.column is not None:
+            return value[self.column].item()
+        if value.ndim:
+            value = value.view()
+            value.flags.writeable = False
+            return value
+        return value.item()
+
+    def __set__(self, bird: "Bird", value: "Vector2 | tuple[float, float] | float | bool") -> None:
+        array = getattr(bird.flock, self.array)
+        if self.column is None:
+            array[bird.index] = value
+        else:
+            array[bird.index, self.column] = value
+
+
+class BirdFlock:
+    """Holds the movement state of a group of birds as NumPy arrays.
+
+    Each bird owns one row of the arrays, so the whole flock is advanced with a handful of vectorized
+    operations per frame instead of one update() call per bird. A shared flock is updated by its owner,
+    and the update() of its birds does nothing.
+    """
+
+    ARRAYS = ("position", "velocity", "target_angle", "turn_speed", "turn_chance", "wing_speed", "wing_angle", "alive")
+
+    def __init__(self, width: int, height: int, *, shared: bool = False) -> None:
+        """Initialize an empty BirdFlock.
+
+        Args:
+        ----
+            width (int): The width of the simulation area.
+            height (int): The height of the simulation area.
+            shared (bool): Whether the flock is updated by its owner rather than through its birds.
+
+        """
+        self.width = width
+        self.height = height
+        self.shared = shared
+        self.bounds = np.array([width, height * 0.6], dtype=np.float32)
+        self.rng = np.random.default_rng()
+        self.birds: list[Bird] = []
+
+        self.position = np.zeros((0, 2), dtype=np.float32)
+        self.velocity = np.zeros((0, 2), dtype=np.float32)
+        self.target_angle = np.zeros(0, dtype=np.float32)
+        self.turn_speed = np.zeros(0, dtype=np.float32)
+        self.turn_chance = np.zeros(0, dtype=np.float32)
+        # Flap phases grow with the tick count, so they need double precision
+        self.wing_speed = np.zeros(0, dtype=np.float64)
+        self.wing_angle = np.zeros(0, dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+
+    def _append(self, bird: "Bird") -> int:
+        for name in self.ARRAYS:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros((1, *array.shape[1:]), dtype=array.dtype)]))
+        self.birds.append(bird)
+        return len(self.birds) - 1
+
+    def _discard(self, index: int) -> None:
+        last = len(self.birds) - 1
+        if index != last:
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[index] = array[last]
+            moved = self.birds[last]
+            moved.index = index
+            self.birds[index] = moved
+        for name in self.ARRAYS:
+            setattr(self, name, getattr(self, name)[:last])
+        self.birds.pop()
+
+    def add(self, bird: "Bird") -> None:
+        """Add a new bird to the flock with a zeroed state.
+
+        Args:
+        ----
+            bird (Bird): The bird to add.
+
+        """
+        bird.flock = self
+        bird.index = self._append(bird)
+
+    def adopt(self, bird: "Bird") -> None:
+        """Move a bird, along with its current state, from its flock into this one.
+
+        Args:
+        ----
+            bird (Bird): The bird to adopt.
+
+        """
+        if bird.flock is self:
+            return
+        index = self._append(bird)
+        for name in self.ARRAYS:
+            getattr(self, name)[index] = getattr(bird.flock, name)[bird.index]
+        bird.flock._discard(bird.index)  # noqa: SLF001
+        bird.flock = self
+        bird.index = index
+
+    def release(self, bird: "Bird") -> None:
+        """Move a bird out of this flock into a flock of its own, keeping its state.
+
+        Args:
+        ----
+            bird (Bird): The bird to release.
+
+        """
+        if bird.flock is self:
+            BirdFlock(self.width, self.height).adopt(bird)
+
+    def update(self, delta: float, activity: float, ticks: int) -> None:
+        """Update the position and state of every bird in the flock.
+
+        Args:
+        ----
+            delta (float): The time elapsed since the last update.
+            activity (float): The current activity level of the simulation.
+            ticks (int): The current time, in milliseconds, shared by all birds for this frame.
+
+        """
+        count = len(self.birds)
+        if not count:
+            return
+
+        self.position += self.velocity * (activity * delta * 60)
+
+        outside = (self.position < 0) | (self.position > self.bounds)
+        self.velocity[outside] *= -1
+        np.clip(self.position, 0, self.bounds, out=self.position)
+
+        # Draw every random number the flock needs this frame at once: turn rolls, turn angles and death rolls
+        turn_rolls, turn_angles, death_rolls = self.rng.random((3, count))
+
+        turning = turn_rolls < self.turn_chance
+        self.target_angle[turning] = (turn_angles[turning] * 2 - 1) * (math.pi / 4)
+
+        turn = np.minimum(np.abs(self.target_angle), self.turn_speed * delta) * np.sign(self.target_angle)
+        turn[np.abs(self.target_angle) <= 0.01] = 0
+        cos_turn = np.cos(turn)
+        sin_turn = np.sin(turn)
+        velocity_x = self.velocity[:, 0].copy()
+        self.velocity[:, 0] = velocity_x * cos_turn - self.velocity[:, 1] * sin_turn
+        self.velocity[:, 1] = velocity_x * sin_turn + self.velocity[:, 1] * cos_turn
+        self.target_angle -= turn
+
+        self.wing_angle[:] = _wing_angle(ticks, self.wing_speed)
+
+        self.alive &= death_rolls >= 0.001 * delta
 
 
 class Bird(Critter):
     """Represents a bird in the ecosystem simulation.
 
-    This class handles the bird's movement, appearance, and lifecycle.
+    This class handles the bird's movement, appearance, and lifecycle. The movement state is stored
+    in a row of the bird's BirdFlock, which the ecosystem updates for all of its birds at once.
     """
 
+    x = _FlockField("position", 0)
+    y = _FlockField("position", 1)
+    position = _FlockField("position")
+    velocity = _FlockField("velocity")
+    target_angle = _FlockField("target_angle")
+    turn_speed = _FlockField("turn_speed")
+    turn_chance = _FlockField("turn_chance")
+    wing_speed = _FlockField("wing_speed")
+    wing_angle = _FlockField("wing_angle")
+    alive = _FlockField("alive")
+
     def __init__(self, member_id: int, x: int, y: int, width: int, height: int, avatar: bytes | None = None) -> None:
         """Initialize a new Bird instance.
 
@@ -27,10 +257,13 @@ class Bird(Critter):
 
         """
         self.max_height = height * 0.6
+        self._dirty = True
+        self.flock: BirdFlock
+        self.index: int
+        BirdFlock(width, height).add(self)
         super().__init__(
             member_id, random.randint(0, width), random.randint(0, int(self.max_height)), width, height, avatar
         )
-        self.position = Vector2(self.x, self.y)
         self.velocity = Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * 2
         self.size = random.uniform(15, 25)
         self.color = self.generate_color()
@@ -40,6 +273,38 @@ class Bird(Critter):
         self.target_angle = 0
         self.turn_speed = random.uniform(0.5, 1.5)
 
+    @property
+    def size(self) -> float:
+        """The radius of the bird's body.
+
+        Returns
+        -------
+            float: The radius of the bird's body.
+
+        """
+        return self._size
+
+    @size.setter
+    def size(self, size: float) -> None:
+        self._size = size
+        self._dirty = True
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """The color of the bird's body and wings.
+
+        Returns
+        -------
+            tuple[int, int, int]: A tuple representing an RGB color.
+
+        """
+        return self._color
+
+    @color.setter
+    def color(self, color: tuple[int, int, int]) -> None:
+        self._color = color
+        self._dirty = True
+
     def generate_color(self) -> tuple[int, int, int]:
         """Generate a random color for the bird.
 
@@ -61,7 +326,10 @@ class Bird(Critter):
         self.alive = False
 
     def update(self, delta: float, activity: float) -> None:
-        """Update the bird's position and state.
+        """Update the bird's position and state by updating its flock.
+
+        Birds in a shared flock, such as an ecosystem's, are left alone: the flock's owner updates all of
+        them once per frame, so updating each bird in turn would step the flock once per bird.
 
         Args:
         ----
@@ -69,88 +337,162 @@ class Bird(Critter):
             activity (float): The current activity level of the simulation.
 
         """
-        self.position += self.velocity * activity * delta * 60
-
-        if self.position.x < 0 or self.position.x > self.width:
-            self.velocity.x *= -1
-        if self.position.y < 0 or self.position.y > self.max_height:
-            self.velocity.y *= -1
-
-        self.position.x = max(0, min(self.position.x, self.width))
-        self.position.y = max(0, min(self.position.y, self.max_height))
-
-        if random.random() < self.turn_chance:
-            self.target_angle = random.uniform(-math.pi / 4, math.pi / 4)
-
-        if abs(self.target_angle) > 0.01:
-            turn_amount = self.turn_speed * delta
-            turn_direction = 1 if self.target_angle > 0 else -1
-            actual_turn = min(abs(self.target_angle), turn_amount) * turn_direction
-
-            self.velocity.rotate_ip(math.degrees(actual_turn))
-            self.target_angle -= actual_turn
-
-        self.wing_angle = math.sin(pygame.time.get_ticks() * self.wing_speed * 0.001) * 45
-
-        if random.random() < 0.001 * delta:
-            self.alive = False
-
-        self.x, self.y = self.position.x, self.position.y
-
-    def draw(self, surface: Surface) -> None:
-        """Draw the bird on the given surface."""
-        # Create a surface for the bird
-        bird_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-
-        # Create a mask surface for the bird's shape
-        mask_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(mask_surface, (255, 255, 255), (int(self.size), int(self.size)), int(self.size))
-
-        # Draw the avatar and apply the mask if available
-        if self.avatar_surface:
-            avatar_scaled = pygame.transform.scale(self.avatar_surface, (int(self.size * 2), int(self.size * 2)))
-            avatar_scaled.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            bird_surface.blit(avatar_scaled, (0, 0))
-
-        # Draw the bird body shape with transparency
-        body_color = (*self.color, 150)  # Add alpha value for transparency
-        body_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(body_surface, body_color, (int(self.size), int(self.size)), int(self.size))
-        bird_surface.blit(body_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
-
-        # Draw the combined bird surface on the main surface
-        surface.blit(bird_surface, (int(self.position.x - self.size), int(self.position.y - self.size)))
-
-        # Draw wings (slightly transparent)
-        wing_color = (*self.color, 100)  # More transparent wings
-        left_wing = self.position + Vector2(-self.size, 0).rotate(self.wing_angle)
-        right_wing = self.position + Vector2(self.size, 0).rotate(-self.wing_angle)
-        pygame.draw.polygon(surface, wing_color, [self.position, left_wing, right_wing])
-
-        # Draw eye
-        eye_position = self.position + self.velocity.normalize() * self.size * 0.5
-        pygame.draw.circle(surface, (255, 255, 255), (int(eye_position.x), int(eye_position.y)), int(self.size * 0.2))
-        pygame.draw.circle(surface, (0, 0, 0), (int(eye_position.x), int(eye_position.y)), int(self.size * 0.1))
-
-        # Draw beak
-        beak_position = self.position + self.velocity.normalize() * self.size
-        pygame.draw.polygon(
-            surface,
-            (255, 200, 0),
-            [
-                beak_position,
-                beak_position
-                + Vector2(self.size * 0.3, self.size * 0.1).rotate(self.velocity.angle_to(Vector2(1, 0))),
-                beak_position
-                + Vector2(self.size * 0.3, -self.size * 0.1).rotate(self.velocity.angle_to(Vector2(1, 0))),
-            ],
+        if self.flock.shared:
+            return
+        self.flock.update(delta, activity, pygame.time.get_ticks())
+
+    def _rebuild_body(self) -> None:
+        """Re-render the cached body and drop the cached overlays after the bird's size or color changed."""
+        self._body_surface = self._render_body()
+        self._eye_surface = self._render_eye()
+        self._wing_overlays: dict[int, tuple[pygame.Surface, int, int]] = {}
+        self._beak_overlays: dict[int, tuple[pygame.Surface, int, int]] = {}
+        self._dirty = False
+
+    def _render_body(self) -> pygame.Surface:
+        """Compose the bird's circular body with its avatar.
+
+        The body only changes with the bird's size or color, so it is rendered once, with premultiplied alpha,
+        and reused every frame until then.
+
+        Returns
+        -------
+            pygame.Surface: The composed body surface.
+
+        """
+        diameter = int(self.size * 2)
+        inside = circle_stencil(diameter, int(self.size))
+
+        # The body is a slightly transparent circle, brightened by the avatar where it is available
+        rgb = np.broadcast_to(np.array(self.color, dtype=np.uint8), (diameter, diameter, 3))
+        alpha = np.full((diameter, diameter), 150, dtype=np.uint8)
+        avatar_scaled = self.scaled_avatar(diameter)
+        if avatar_scaled:
+            rgb = np.maximum(pygame.surfarray.array3d(avatar_scaled), rgb)
+            alpha = np.maximum(pygame.surfarray.array_alpha(avatar_scaled), alpha)
+
+        return premultiplied_surface(rgb * inside[..., np.newaxis], alpha * inside)
+
+    def _wing_overlay(self, step: int) -> tuple[pygame.Surface, int, int]:
+        """Return the cached wings for a quantized wing angle, drawing them on first use.
+
+        Args:
+        ----
+            step (int): The wing angle, in multiples of _WING_ANGLE_QUANTUM degrees.
+
+        Returns:
+        -------
+            tuple[pygame.Surface, int, int]: The wings and their offset from the bird's centre.
+
+        """
+        overlay = self._wing_overlays.get(step)
+        if overlay is None:
+            wing_angle = math.radians(step * _WING_ANGLE_QUANTUM)
+            wing_x = self.size * math.cos(wing_angle)
+            wing_y = self.size * math.sin(wing_angle)
+            points = [(0, 0), (-wing_x, -wing_y), (wing_x, -wing_y)]
+            surface, left, top = _overlay_canvas(points)
+            pygame.draw.polygon(surface, self.color, [(x - left, y - top) for x, y in points])
+            overlay = (surface.convert_alpha(), left, top)
+            self._wing_overlays[step] = overlay
+        return overlay
+
+    def _render_eye(self) -> pygame.Surface:
+        """Draw the bird's eye, a white circle with a black pupil, which looks the same in every direction.
+
+        Returns
+        -------
+            pygame.Surface: The eye, centred on the surface.
+
+        """
+        eye_radius = int(self.size * 0.2)
+        eye_surface = pygame.Surface((eye_radius * 2, eye_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(eye_surface, (255, 255, 255), (eye_radius, eye_radius), eye_radius)
+        pygame.draw.circle(eye_surface, (0, 0, 0), (eye_radius, eye_radius), int(self.size * 0.1))
+        return eye_surface.convert_alpha()
+
+    def _beak_overlay(self, step: int) -> tuple[pygame.Surface, int, int]:
+        """Return the cached beak for a quantized heading, drawing it on first use.
+
+        Args:
+        ----
+            step (int): The heading, in steps of a full turn divided by _HEADING_STEPS.
+
+        Returns:
+        -------
+            tuple[pygame.Surface, int, int]: The beak and its offset from the bird's centre.
+
+        """
+        overlay = self._beak_overlays.get(step)
+        if overlay is not None:
+            return overlay
+
+        size = self.size
+        heading = step * 2 * math.pi / _HEADING_STEPS
+        direction_x, direction_y = math.cos(heading), math.sin(heading)
+
+        # The beak tips are rotated by the angle from the heading to the x-axis, whose cosine and sine are
+        # the components of the heading, so no angle needs to be computed
+        beak_x = direction_x * size
+        beak_y = direction_y * size
+        tip_x = beak_x + size * 0.3 * direction_x
+        tip_y = beak_y - size * 0.3 * direction_y
+        spread_x = size * 0.1 * direction_y
+        spread_y = size * 0.1 * direction_x
+        beak = [(beak_x, beak_y), (tip_x + spread_x, tip_y + spread_y), (tip_x - spread_x, tip_y - spread_y)]
+
+        surface, left, top = _overlay_canvas(beak)
+        pygame.draw.polygon(surface, (255, 200, 0), [(x - left, y - top) for x, y in beak])
+
+        # Evict the beak cached first once the cache is full
+        if len(self._beak_overlays) >= _MAX_BEAK_OVERLAYS:
+            del self._beak_overlays[next(iter(self._beak_overlays))]
+        overlay = (surface.convert_alpha(), left, top)
+        self._beak_overlays[step] = overlay
+        return overlay
+
+    def collect(self, blit_sequence: BlitSequence) -> None:
+        """Append the bird's body, wings, eye and beak to the blit sequence.
+
+        The body and eye are rendered once, the wings once per quantized wing angle and the beak once per
+        recent quantized heading, so drawing a bird is four blits.
+
+        Args:
+        ----
+            blit_sequence (BlitSequence): The list of (surface, destination) pairs to append to.
+
+        """
+        if self._dirty:
+            self._rebuild_body()
+
+        # Read straight from the flock to avoid allocating vectors every frame
+        px, py = self.flock.position[self.index].tolist()
+        vx, vy = self.flock.velocity[self.index].tolist()
+        center_x, center_y = round(px), round(py)
+
+        blit_sequence.append(
+            (self._body_surface, (int(px - self.size), int(py - self.size)), None, pygame.BLEND_PREMULTIPLIED)
         )
 
+        wings, left, top = self._wing_overlay(round(self.wing_angle / _WING_ANGLE_QUANTUM))
+        blit_sequence.append((wings, (center_x + left, center_y + top)))
+
+        # The eye is placed exactly, so only the beak needs a surface per heading
+        speed = math.hypot(vx, vy)
+        direction_x, direction_y = (vx / speed, vy / speed) if speed else (1.0, 0.0)
+        eye_radius = self._eye_surface.get_width() // 2
+        eye_x = round(px + direction_x * self.size * 0.5) - eye_radius
+        eye_y = round(py + direction_y * self.size * 0.5) - eye_radius
+        blit_sequence.append((self._eye_surface, (eye_x, eye_y)))
+
+        heading_step = round(math.atan2(vy, vx) * _HEADING_STEPS / (2 * math.pi)) % _HEADING_STEPS
+        beak, left, top = self._beak_overlay(heading_step)
+        blit_sequence.append((beak, (center_x + left, center_y + top)))
+
     def spawn(self) -> None:
         """Respawn the bird at a random position in the top portion of the simulation area."""
         self.alive = True
-        self.position = Vector2(random.randint(0, self.width), random.randint(0, int(self.max_height)))
-        self.x, self.y = self.position.x, self.position.y
+        self.position = (random.randint(0, self.width), random.randint(0, int(self.max_height)))
 
     def despawn(self) -> None:
         self.alive = False
@@ -1,9 +1,79 @@
+import functools
 import io
 import logging
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pygame
 
+# Items are (surface, destination) or (surface, destination, area, special_flags), as accepted by Surface.blits
+BlitSequence = list[tuple[pygame.Surface, tuple[int, int]] | tuple[pygame.Surface, tuple[int, int], None, int]]
+
+
+@functools.lru_cache(maxsize=128)
+def circle_stencil(diameter: int, radius: int) -> np.ndarray:
+    """Return a boolean mask of a filled circle centred at (radius, radius).
+
+    The circle is rasterized by pygame.draw.circle, so the mask matches the shapes drawn elsewhere.
+
+    Args:
+    ----
+        diameter (int): The width and height of the mask.
+        radius (int): The radius of the circle.
+
+    Returns:
+    -------
+        np.ndarray: A (diameter, diameter) boolean array, indexed as [x, y], that is True inside the circle.
+
+    """
+    surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 255, 255), (radius, radius), radius)
+    stencil = pygame.surfarray.array_alpha(surface) > 0
+    stencil.flags.writeable = False
+    return stencil
+
+
+def premultiplied_surface(rgb: np.ndarray, alpha: np.ndarray) -> pygame.Surface:
+    """Create a surface with premultiplied alpha from straight color and alpha arrays.
+
+    The surface is meant to be blitted with the BLEND_PREMULTIPLIED flag, which composites it in a single pass.
+
+    Args:
+    ----
+        rgb (np.ndarray): A (width, height, 3) array with the straight (non-premultiplied) colors.
+        alpha (np.ndarray): A (width, height) array with the alpha values.
+
+    Returns:
+    -------
+        pygame.Surface: The premultiplied surface.
+
+    """
+    width, height = alpha.shape
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[:] = rgb.astype(np.uint16) * alpha[..., np.newaxis] // 255
+    pygame.surfarray.pixels_alpha(surface)[:] = alpha
+    return surface.convert_alpha()
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_avatar(data: bytes) -> pygame.Surface:
+    """Decode avatar image data into a 64x64 surface in the display's pixel format.
+
+    A member's avatar is decoded once and shared by every critter created for them, so the returned
+    surface must not be modified.
+
+    Args:
+    ----
+        data (bytes): The encoded avatar image.
+
+    Returns:
+    -------
+        pygame.Surface: The decoded avatar.
+
+    """
+    avatar_image = pygame.image.load(io.BytesIO(data))
+    return pygame.transform.scale(avatar_image, (64, 64)).convert_alpha()
+
 
 class Critter(ABC):
     """Abstract base class representing a critter in the ecosystem simulation.
@@ -36,15 +106,37 @@ class Critter(ABC):
 
         self.avatar = avatar
         self.avatar_surface = None
+        self._scaled_avatars: dict[int, pygame.Surface] = {}
         if self.avatar:
             try:
-                avatar_io = io.BytesIO(self.avatar)
-                avatar_image = pygame.image.load(avatar_io)
-                self.avatar_surface = pygame.transform.scale(avatar_image, (64, 64)).convert_alpha()
+                self.avatar_surface = _decode_avatar(self.avatar)
             except pygame.error as e:
                 print(f"Failed to create avatar surface for critter {member_id}: {e}")
             except Exception:
-                logging.exception("Unexpected error creating avatar surface for snake %s", member_id)
+                logging.exception("Unexpected error creating avatar surface for critter %s", member_id)
+
+    def scaled_avatar(self, size: int) -> pygame.Surface | None:
+        """Return the avatar scaled to a square of the given size.
+
+        Scaled avatars are cached and already in the display's pixel format, so they can be used every frame
+        without rescaling or converting them again. Critters pre-scale the sizes they need on creation.
+
+        Args:
+        ----
+            size (int): The width and height of the scaled avatar.
+
+        Returns:
+        -------
+            pygame.Surface | None: The scaled avatar, or None if the critter has no avatar.
+
+        """
+        if self.avatar_surface is None or size < 1:
+            return None
+        scaled = self._scaled_avatars.get(size)
+        if scaled is None:
+            scaled = pygame.transform.scale(self.avatar_surface, (size, size)).convert_alpha()
+            self._scaled_avatars[size] = scaled
+        return scaled
 
     @abstractmethod
     def activate(self) -> None:
@@ -66,6 +158,18 @@ class Critter(ABC):
         """
 
     @abstractmethod
+    def collect(self, blit_sequence: BlitSequence) -> None:
+        """Append the critter's pre-rendered surfaces to a blit sequence.
+
+        The ecosystem gathers the sequences of all critters and dispatches them with a single
+        ``Surface.blits`` call per frame instead of drawing each critter separately.
+
+        Args:
+        ----
+            blit_sequence (BlitSequence): The list of (surface, destination) pairs to append to.
+
+        """
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the critter on the given surface.
 
@@ -74,6 +178,9 @@ class Critter(ABC):
             surface (pygame.Surface): The surface to draw the critter on.
 
         """
+        blit_sequence = []
+        self.collect(blit_sequence)
+        surface.blits(blit_sequence, doreturn=False)
 
     @abstractmethod
     def spawn(self) -> None:
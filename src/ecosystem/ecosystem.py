@@ -3,6 +3,7 @@ import atexit
 import contextlib
 import io
 import multiprocessing
+import queue
 import time
 from collections import deque
 from collections.abc import Coroutine
@@ -31,8 +32,9 @@ from bot.discord_event import (
 )
 from storage import Database, UserInfo
 
-from .bird import Bird
+from .bird import Bird, BirdFlock
 from .cloud_manager import CloudManager
+from .critter import Critter
 from .frog import Frog
 from .reaction_emoji import ReactionEmoji
 from .snake import Snake
@@ -55,6 +57,7 @@ class Ecosystem:
         gif_duration: int = 5,
         fps: int = 30,
         interactive: bool = True,
+        gif_queue: "multiprocessing.Queue | None" = None,
     ) -> None:
         """Initialize the Ecosystem.
 
@@ -66,6 +69,8 @@ class Ecosystem:
             gif_duration (int): Duration of each GIF in seconds.
             fps (int): Frames per second for the simulation.
             interactive (bool): Whether the ecosystem is interactive or not.
+            gif_queue (multiprocessing.Queue | None): Queue that generated GIFs are put on. A new queue is
+                created if not given.
 
         """
         self.width = width
@@ -84,6 +89,7 @@ class Ecosystem:
         ]
 
         self.critters = []
+        self.bird_flock = BirdFlock(width, height, shared=True)
         self.speech_bubbles = []
         self.reaction_emojis = []
 
@@ -102,7 +108,7 @@ class Ecosystem:
             self.shared_frames = SharedNumpyArray((self.frames_per_gif, height, width, 3))
             self.current_frame_index = multiprocessing.Value("i", 0)
             self.frame_count_queue = multiprocessing.Queue()
-            self.gif_info_queue = multiprocessing.Queue()
+            self.gif_info_queue = gif_queue if gif_queue is not None else multiprocessing.Queue()
             self.gif_process = multiprocessing.Process(
                 target=self.run_gif_generation_process,
                 args=(
@@ -160,6 +166,7 @@ class Ecosystem:
         """
         self.elapsed_time += delta
 
+        self.bird_flock.update(delta, self.activity, pygame.time.get_ticks())
         for critter in self.critters:
             critter.update(delta, self.activity)
 
@@ -175,9 +182,37 @@ class Ecosystem:
         for emoji in self.reaction_emojis:
             emoji.update(delta)
 
+    def add_critter(self, critter: Critter) -> None:
+        """Add a critter to the ecosystem.
+
+        Birds are moved into the ecosystem's flock so they are updated together.
+
+        Args:
+        ----
+            critter (Critter): The critter to add.
+
+        """
+        self.critters.append(critter)
+        if isinstance(critter, Bird):
+            self.bird_flock.adopt(critter)
+
+    def remove_critter(self, critter: Critter) -> None:
+        """Remove a critter from the ecosystem.
+
+        Args:
+        ----
+            critter (Critter): The critter to remove.
+
+        """
+        if critter in self.critters:
+            self.critters.remove(critter)
+        if isinstance(critter, Bird):
+            self.bird_flock.release(critter)
+
     def _clean_up_entities(self) -> None:
         """Remove dead entities from the ecosystem."""
-        self.critters = [critter for critter in self.critters if critter.alive]
+        for critter in [critter for critter in self.critters if not critter.alive]:
+            self.remove_critter(critter)
 
     def draw(self) -> pygame.Surface:
         """Draw the current state of the ecosystem.
@@ -207,8 +242,10 @@ class Ecosystem:
         for bubble in self.speech_bubbles:
             bubble.draw(self.surface)
 
+        blit_sequence = []
         for critter in self.critters:
-            critter.draw(self.surface)
+            critter.collect(blit_sequence)
+        self.surface.blits(blit_sequence, doreturn=False)
 
         for emoji in self.reaction_emojis:
             emoji.draw(self.surface)
@@ -250,7 +287,8 @@ class Ecosystem:
 
     def reset(self) -> None:
         """Reset the ecosystem to its initial state."""
-        self.critters.clear()
+        for critter in list(self.critters):
+            self.remove_critter(critter)
         self.activity = 1
         self.elapsed_time = 0
 
@@ -498,7 +536,12 @@ class EcosystemManager:
             screen = pygame.Surface((self.width, self.height))
 
         ecosystem = Ecosystem(
-            self.width, self.height, generate_gifs=self.generate_gifs, fps=self.fps, interactive=self.interactive
+            self.width,
+            self.height,
+            generate_gifs=self.generate_gifs,
+            fps=self.fps,
+            interactive=self.interactive,
+            gif_queue=self.gif_queue,
         )
         ecosystem.setup_ui()
 
@@ -533,10 +576,6 @@ class EcosystemManager:
             if self.interactive:
                 pygame.display.flip()
 
-            if ecosystem.generate_gifs and not ecosystem.gif_info_queue.empty():
-                gif_data, timestamp = ecosystem.gif_info_queue.get()
-                self.gif_queue.put((gif_data, timestamp))
-
             while not self.command_queue.empty():
                 command, args = self.command_queue.get()
                 if command == "stop":
@@ -695,7 +734,7 @@ class EcosystemManager:
             )
             critter.spawn()
             self.user_critters[user_id] = critter
-            ecosystem.critters.append(critter)
+            ecosystem.add_critter(critter)
 
     def _remove_inactive_users(self, ecosystem: Ecosystem, current_time: datetime) -> None:
         """Remove inactive users from the ecosystem.
@@ -716,20 +755,29 @@ class EcosystemManager:
     def _remove_critter(self, ecosystem: Ecosystem, user_id: int) -> None:
         if user_id in self.user_critters:
             critter = self.user_critters.pop(user_id)
-            ecosystem.critters.discard(critter)
+            ecosystem.remove_critter(critter)
         self.last_activity.pop(user_id, None)
 
-    def get_latest_gif(self) -> tuple[bytes, float] | None:
+    def get_latest_gif(self, timeout: float | None = 0) -> tuple[bytes, float] | None:
         """Get the latest generated GIF.
 
-        Returns
+        The GIF generation process puts each GIF on the queue as soon as it is encoded, so waiting with a
+        timeout returns as soon as one is ready instead of polling.
+
+        Args:
+        ----
+            timeout (float | None): How long to wait for a GIF, in seconds. 0 returns immediately and None waits
+                until a GIF is available.
+
+        Returns:
         -------
             tuple[bytes, float] | None: Tuple containing GIF data and timestamp, or None if no GIF is available.
 
         """
-        if not self.gif_queue.empty():
-            return self.gif_queue.get()
-        return None
+        try:
+            return self.gif_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
 
     async def _simulate_random_message(self, ecosystem: Ecosystem) -> None:
         guild_id = random.randint(1, 1000000)
@@ -3,7 +3,7 @@ import random
 
 import pygame
 
-from ecosystem.critter import Critter
+from ecosystem.critter import BlitSequence, Critter
 
 
 class Frog(Critter):
@@ -37,6 +37,9 @@ class Frog(Critter):
         self.jump_duration = random.uniform(0.5, 1.0)
         self.rest_duration = random.uniform(1.0, 3.0)
 
+        # Frogs die at a rate of 1% per second; drawing the lifetime up front replaces a roll every frame
+        self.lifetime = random.expovariate(0.01)
+
         self.state = "rest"
         self.state_time = 0
         self.jump_start_y = self.y
@@ -44,6 +47,15 @@ class Frog(Critter):
 
         self.scale = 1.0
 
+        # Once spawned, a frog stays between the ground and the top of its jump, so it is only drawn at a few
+        # sizes; render those up front and any others on first use
+        self._sprites: dict[int, pygame.Surface] = {}
+        ground = self.height - 20
+        smallest = int(self.size * (0.5 + (ground - self.jump_height) / self.height * 0.5))
+        largest = int(self.size * (0.5 + ground / self.height * 0.5))
+        for size in range(smallest, largest + 1):
+            self._sprite(size)
+
     def activate(self) -> None:
         """Activates the frog."""
         self.alive = True
@@ -76,7 +88,8 @@ class Frog(Critter):
                 self.state_time = 0
                 self.y = self.jump_start_y
 
-        if random.random() < 0.01 * delta:
+        self.lifetime -= delta
+        if self.lifetime <= 0:
             self.deactivate()
 
     def start_jump(self) -> None:
@@ -91,23 +104,20 @@ class Frog(Critter):
         jump_distance = random.uniform(50, 150)
 
         new_x = self.x + random.uniform(-jump_distance, jump_distance)
-
         self.jump_target_x = max(self.size / 2, min(self.width - self.size / 2, new_x))
-        new_x = self.x + random.uniform(-jump_distance, jump_distance)
 
-        self.jump_target_x = max(self.size / 2, min(self.width - self.size / 2, new_x))
-
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the frog on the given surface.
+    def _render_sprite(self, scaled_size: int) -> pygame.Surface:
+        """Render the frog's body, avatar, eyes and mouth onto a new surface.
 
         Args:
         ----
-            surface (pygame.Surface): The surface to draw the frog on.
+            scaled_size (int): The width and height of the frog at its current scale.
 
-        """
-        self.scale = 0.5 + (self.y / self.height) * 0.5
-        scaled_size = int(self.size * self.scale)
+        Returns:
+        -------
+            pygame.Surface: The rendered frog.
 
+        """
         # Create a surface for the frog body
         frog_surface = pygame.Surface((scaled_size, scaled_size), pygame.SRCALPHA)
 
@@ -116,10 +126,10 @@ class Frog(Critter):
         pygame.draw.ellipse(mask_surface, (255, 255, 255), pygame.Rect(0, 0, scaled_size, scaled_size))
 
         # Draw the avatar and apply the mask if available
-        if self.avatar_surface:
-            avatar_scaled = pygame.transform.scale(self.avatar_surface, (scaled_size, scaled_size))
-            avatar_scaled.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        avatar_scaled = self.scaled_avatar(scaled_size)
+        if avatar_scaled:
             frog_surface.blit(avatar_scaled, (0, 0))
+            frog_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
         # Draw the frog body shape with transparency
         body_color = (*self.color, 150)  # Add alpha value for transparency
@@ -127,28 +137,66 @@ class Frog(Critter):
         pygame.draw.ellipse(body_surface, body_color, pygame.Rect(0, 0, scaled_size, scaled_size))
         frog_surface.blit(body_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
 
-        # Draw the combined frog surface on the main surface
-        surface.blit(frog_surface, (int(self.x - scaled_size // 2), int(self.y - scaled_size // 2)))
+        # Eyes and mouth are drawn relative to the centre of the frog surface
+        center = scaled_size // 2
 
         # Draw eyes (white part)
         eye_size = scaled_size // 4
-        left_eye_pos = (int(self.x - scaled_size // 4), int(self.y - scaled_size // 4))
-        right_eye_pos = (int(self.x + scaled_size // 4), int(self.y - scaled_size // 4))
-        pygame.draw.circle(surface, self.eye_color, left_eye_pos, eye_size)
-        pygame.draw.circle(surface, self.eye_color, right_eye_pos, eye_size)
+        left_eye_pos = (center - scaled_size // 4, center - scaled_size // 4)
+        right_eye_pos = (center + scaled_size // 4, center - scaled_size // 4)
+        pygame.draw.circle(frog_surface, self.eye_color, left_eye_pos, eye_size)
+        pygame.draw.circle(frog_surface, self.eye_color, right_eye_pos, eye_size)
 
         # Draw pupils
         pupil_size = eye_size // 2
-        pygame.draw.circle(surface, self.pupil_color, left_eye_pos, pupil_size)
-        pygame.draw.circle(surface, self.pupil_color, right_eye_pos, pupil_size)
+        pygame.draw.circle(frog_surface, self.pupil_color, left_eye_pos, pupil_size)
+        pygame.draw.circle(frog_surface, self.pupil_color, right_eye_pos, pupil_size)
 
         # Draw mouth
-        mouth_rect = pygame.Rect(self.x - scaled_size // 4, self.y, scaled_size // 2, scaled_size // 4)
-        pygame.draw.arc(surface, (50, 50, 50), mouth_rect, math.pi, 2 * math.pi, 2)
+        mouth_rect = pygame.Rect(center - scaled_size // 4, center, scaled_size // 2, scaled_size // 4)
+        pygame.draw.arc(frog_surface, (50, 50, 50), mouth_rect, math.pi, 2 * math.pi, 2)
+
+        return frog_surface.convert_alpha()
+
+    def _sprite(self, scaled_size: int) -> pygame.Surface:
+        """Return the cached sprite for the given size, rendering it on first use.
+
+        Args:
+        ----
+            scaled_size (int): The width and height of the frog at its current scale.
+
+        Returns:
+        -------
+            pygame.Surface: The rendered frog.
+
+        """
+        sprite = self._sprites.get(scaled_size)
+        if sprite is None:
+            sprite = self._render_sprite(scaled_size)
+            self._sprites[scaled_size] = sprite
+        return sprite
+
+    def collect(self, blit_sequence: BlitSequence) -> None:
+        """Append the frog's sprite for its current scale to the blit sequence.
+
+        Args:
+        ----
+            blit_sequence (BlitSequence): The list of (surface, destination) pairs to append to.
+
+        """
+        self.scale = 0.5 + (self.y / self.height) * 0.5
+        scaled_size = int(self.size * self.scale)
+        if scaled_size < 1:
+            return
+
+        blit_sequence.append(
+            (self._sprite(scaled_size), (int(self.x - scaled_size // 2), int(self.y - scaled_size // 2)))
+        )
 
     def spawn(self) -> None:
         """Spawn the frog in the ecosystem."""
         self.activate()
+        self.lifetime = random.expovariate(0.01)
         self.y = self.height - 20
         self.x = random.randint(0, self.width)
         self.scale = 0.1
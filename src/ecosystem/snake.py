@@ -1,10 +1,11 @@
 import math
 import random
 
+import numpy as np
 import pygame
 from pygame import Color, Surface, Vector2
 
-from ecosystem.critter import Critter
+from ecosystem.critter import BlitSequence, Critter, circle_stencil, premultiplied_surface
 
 
 class Snake(Critter):
@@ -27,18 +28,55 @@ class Snake(Critter):
 
         """
         super().__init__(member_id, x, y, width, height, avatar)
-        self.segments = [Vector2(x, y)]
-        self.x = x
-        self.y = y
         self.direction = Vector2(1, 0)
         self.min_y = int(self.height * 0.65)
         self.max_y = int(self.height * 0.80)
         self.speed = 2
         self.length = 50
+
+        # Segment positions live in a ring buffer; the head is at self._head_idx and the body follows it.
+        # Every position is stored twice, length slots apart, so the ordered segments are always a contiguous slice
+        self._segments = np.zeros((self.length * 2, 2), dtype=np.float32)
+        self._flat_segments = memoryview(self._segments.reshape(-1))
+        self._head_idx = 0
+        self._segment_count = 1
+        self._fade = 1 - np.arange(self.length) / self.length
+
+        # Per-segment drawing parameters only depend on the segment's place along the body, so they are
+        # tabulated once; each frame just scales them
+        self._radii_f = 10 * self._fade + 5
+        self._alpha_bins = (255 * self._fade).astype(np.int32) >> 4
+        self._wave_phases = np.arange(self.length) * 0.2
+        self.reset_segments(x, y)
+
+        self._dirty = True
         self.color = self.generate_color()
         self.target = self.get_new_target()
         self.state = "inactive"
         self.scale = 0.1
+        self._circle_cache: dict[tuple[tuple[int, int, int], int], Surface] = {}
+        self._segment_cache: dict[tuple[int, int], Surface] = {}
+        self._head_cache: dict[int, Surface] = {}
+
+        # Pre-scale the avatar for every head size the spawn animation goes through
+        for radius in range(1, 16):
+            self.scaled_avatar(radius * 2)
+
+    @property
+    def color(self) -> Color:
+        """The color of the snake's body and head.
+
+        Returns
+        -------
+            Color: The color of the snake.
+
+        """
+        return self._color
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        self._color = color
+        self._dirty = True
 
     def generate_color(self) -> Color:
         """Generate a random color for the snake.
@@ -50,6 +88,37 @@ class Snake(Critter):
         """
         return pygame.Color(random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
 
+    @property
+    def segments(self) -> np.ndarray:
+        """The positions of the snake's segments, ordered from head to tail.
+
+        Returns
+        -------
+            np.ndarray: A read-only view of shape (segment count, 2) with the segment positions.
+
+        """
+        segments = self._segments[self._head_idx : self._head_idx + self._segment_count]
+        segments.flags.writeable = False
+        return segments
+
+    def reset_segments(self, x: float, y: float) -> None:
+        """Shrink the snake down to a single segment at the given position.
+
+        Args:
+        ----
+            x (float): The x-coordinate of the head.
+            y (float): The y-coordinate of the head.
+
+        """
+        self._head_idx = 0
+        self._segment_count = 1
+        # The slice covers the first slot and its mirror
+        self._segments[:: self.length] = (x, y)
+        self._head_x = float(x)
+        self._head_y = float(y)
+        self.x = int(x)
+        self.y = int(y)
+
     def get_new_target(self) -> Vector2:
         """Generate a new random target position for the snake.
 
@@ -83,78 +152,177 @@ class Snake(Critter):
                 self.state = "inactive"
                 return
 
-        head = self.segments[0]
-        to_target = self.target - head
-        if to_target.length() < 10:
+        head_x = self._head_x
+        head_y = self._head_y
+        if math.hypot(self.target.x - head_x, self.target.y - head_y) < 10:
             self.target = self.get_new_target()
 
-        to_target = self.target - head
-        self.direction = to_target.normalize()
-        new_head = head + self.direction * self.speed * activity * delta * 60
+        direction_x = self.target.x - head_x
+        direction_y = self.target.y - head_y
+        distance = math.hypot(direction_x, direction_y)
+        direction_x /= distance
+        direction_y /= distance
+        self.direction.update(direction_x, direction_y)
+
+        step = self.speed * activity * delta * 60
+        new_x = (head_x + direction_x * step) % self.width  # Wrap around horizontally
+        new_y = max(min(head_y + direction_y * step, self.max_y), self.min_y)
+
+        # Move the head index back one slot, overwriting the oldest segment once the snake is fully grown.
+        # The head is written through a flat memoryview, which costs far less per frame than converting it to
+        # an array for an ndarray assignment
+        self._head_idx = (self._head_idx - 1) % self.length
+        head_slot = 2 * self._head_idx
+        mirror_slot = head_slot + 2 * self.length
+        flat = self._flat_segments
+        flat[head_slot] = flat[mirror_slot] = new_x
+        flat[head_slot + 1] = flat[mirror_slot + 1] = new_y
+        self._segment_count = min(self._segment_count + 1, self.length)
+        self._head_x = new_x
+        self._head_y = new_y
 
-        new_head.y = max(min(new_head.y, self.max_y), self.min_y)
-        new_head.x = new_head.x % self.width  # Wrap around horizontally
+        # Update self.x and self.y to match the new head position
+        self.x = int(new_x)
+        self.y = int(new_y)
 
-        self.segments.insert(0, new_head)
-        if len(self.segments) > self.length:
-            self.segments.pop()
+    def _circle_surface(self, color: Color | tuple[int, int, int], radius: int) -> Surface:
+        """Return a cached surface with a filled circle of the given color and radius.
 
-        # Update self.x and self.y to match the new head position
-        self.x = int(new_head.x)
-        self.y = int(new_head.y)
+        Args:
+        ----
+            color (Color | tuple[int, int, int]): The color of the circle.
+            radius (int): The radius of the circle.
+
+        Returns:
+        -------
+            Surface: A transparent surface of size (2 * radius, 2 * radius) with the circle drawn on it.
+
+        """
+        key = (tuple(color[:3]), radius)
+        circle_surface = self._circle_cache.get(key)
+        if circle_surface is None:
+            circle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(circle_surface, color, (radius, radius), radius)
+            self._circle_cache[key] = circle_surface
+        return circle_surface
+
+    def _segment_surface(self, radius: int, alpha_bin: int) -> Surface:
+        """Return the cached surface for a body segment, drawing it on first use.
 
-    def draw(self, surface: Surface) -> None:
-        """Draw the snake on the given surface.
+        Segment transparency is quantized to 16 levels, so a snake needs at most 16 surfaces per radius.
+        The surfaces use premultiplied alpha and are blitted with BLEND_PREMULTIPLIED.
 
         Args:
         ----
-            surface (Surface): The pygame Surface to draw on.
+            radius (int): The radius of the segment.
+            alpha_bin (int): The transparency level of the segment, from 0 (transparent) to 15 (opaque).
+
+        Returns:
+        -------
+            Surface: A transparent surface of size (2 * radius, 2 * radius) with the segment drawn on it.
 
         """
-        # Draw body segments with sinusoidal wave
-        time = pygame.time.get_ticks() / 1000
-        for i, segment in enumerate(self.segments[1:], 1):
-            radius = int((10 * (1 - i / len(self.segments)) + 5) * self.scale)
-            alpha = int(255 * (1 - i / len(self.segments)))
-            color = (*self.color[:3], alpha)
+        key = (radius, alpha_bin)
+        segment_surface = self._segment_cache.get(key)
+        if segment_surface is None:
+            diameter = radius * 2
+            inside = circle_stencil(diameter, radius)
+            rgb = np.broadcast_to(np.array(self.color[:3], dtype=np.uint8), (diameter, diameter, 3))
+            segment_surface = premultiplied_surface(rgb, inside.astype(np.uint8) * (alpha_bin * 17))
+            self._segment_cache[key] = segment_surface
+        return segment_surface
+
+    def _collect_circle(
+        self, blit_sequence: BlitSequence, color: Color | tuple[int, int, int], center: tuple[int, int], radius: int
+    ) -> None:
+        if radius < 1:
+            return
+        blit_sequence.append((self._circle_surface(color, radius), (center[0] - radius, center[1] - radius)))
 
-            # Apply sinusoidal wave
-            wave_amplitude = 5 * self.scale * (1 - i / len(self.segments))
-            wave_frequency = 0.2
-            wave_speed = 3
-            wave_offset = math.sin(time * wave_speed + i * wave_frequency) * wave_amplitude
+    def _head_surface(self, radius: int) -> Surface:
+        """Return the cached head surface for the given radius, composing it on first use.
 
-            wave_vector = self.direction.rotate(90).normalize() * wave_offset
-            wave_pos = segment + wave_vector
+        The head only changes size while the snake spawns or despawns, so each radius is composed once,
+        with premultiplied alpha.
 
-            pygame.draw.circle(surface, color, (int(wave_pos.x), int(wave_pos.y)), radius)
+        Args:
+        ----
+            radius (int): The radius of the head.
 
-        # Draw head
-        head = self.segments[0]
-        head_radius = int(15 * self.scale)
+        Returns:
+        -------
+            Surface: The head surface with the avatar blended in, if available.
+
+        """
+        head_surface = self._head_cache.get(radius)
+        if head_surface is not None:
+            return head_surface
 
-        # Create a surface for the head
-        head_surface = pygame.Surface((head_radius * 2, head_radius * 2), pygame.SRCALPHA)
+        diameter = radius * 2
+        inside = circle_stencil(diameter, radius)
 
-        # Draw the base color of the head
-        pygame.draw.circle(head_surface, self.color, (head_radius, head_radius), head_radius)
+        # The head is a circle of the snake's color, tinted by the avatar if available
+        rgb = np.broadcast_to(np.array(self.color[:3], dtype=np.uint16), (diameter, diameter, 3))
+        alpha = np.full((diameter, diameter), 255, dtype=np.uint8)
+        avatar_scaled = self.scaled_avatar(diameter)
+        if avatar_scaled:
+            rgb = rgb * pygame.surfarray.array3d(avatar_scaled) // 255
+            alpha = pygame.surfarray.array_alpha(avatar_scaled)
 
-        # Apply avatar if available
-        if self.avatar_surface:
-            avatar_scaled = pygame.transform.scale(self.avatar_surface, (head_radius * 2, head_radius * 2))
+        head_surface = premultiplied_surface(rgb * inside[..., np.newaxis], alpha * inside)
+        self._head_cache[radius] = head_surface
+        return head_surface
 
-            # Create a circular mask
-            mask_surface = pygame.Surface((head_radius * 2, head_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(mask_surface, (255, 255, 255), (head_radius, head_radius), head_radius)
+    def collect(self, blit_sequence: BlitSequence) -> None:
+        """Append the snake's segments, head and eyes to the blit sequence.
 
-            # Apply mask to avatar
-            avatar_scaled.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        Args:
+        ----
+            blit_sequence (BlitSequence): The list of (surface, destination) pairs to append to.
+
+        """
+        # The segment and head surfaces are drawn in the snake's color, so they are rebuilt when it changes
+        if self._dirty:
+            self._segment_cache.clear()
+            self._head_cache.clear()
+            self._dirty = False
 
-            # Blend avatar with head color
-            head_surface.blit(avatar_scaled, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        # Draw body segments with sinusoidal wave
+        time = pygame.time.get_ticks() / 1000
+        segments = self.segments
+        body = slice(1, len(segments))
+        radii = (self._radii_f[body] * self.scale).astype(np.int32)
+        alpha_bins = self._alpha_bins[body]
+
+        # Apply sinusoidal wave
+        wave_amplitude = 5 * self.scale * self._fade[body]
+        wave_speed = 3
+        wave_offsets = np.sin(time * wave_speed + self._wave_phases[body]) * wave_amplitude
+
+        wave_direction = self.direction.rotate(90).normalize()
+        wave_positions = segments[body] + np.outer(wave_offsets, wave_direction)
+
+        blit_sequence.extend(
+            (self._segment_surface(radius, alpha_bin), (x - radius, y - radius), None, pygame.BLEND_PREMULTIPLIED)
+            for (x, y), radius, alpha_bin in zip(
+                wave_positions.astype(int).tolist(), radii.tolist(), alpha_bins.tolist(), strict=True
+            )
+            if radius >= 1 and alpha_bin
+        )
+
+        # Draw head
+        head = Vector2(*segments[0].tolist())
+        head_radius = int(15 * self.scale)
 
-        # Draw the head on the main surface
-        surface.blit(head_surface, (int(head.x - head_radius), int(head.y - head_radius)))
+        if head_radius >= 1:
+            blit_sequence.append(
+                (
+                    self._head_surface(head_radius),
+                    (int(head.x - head_radius), int(head.y - head_radius)),
+                    None,
+                    pygame.BLEND_PREMULTIPLIED,
+                )
+            )
 
         # Draw cuter eyes
         eye_offset = Vector2(7 * self.scale, 0)
@@ -165,16 +333,22 @@ class Snake(Critter):
         pupil_radius = int(3 * self.scale)
 
         # Draw eye whites
-        pygame.draw.circle(surface, (255, 255, 255), (int(left_eye.x), int(left_eye.y)), eye_radius)
-        pygame.draw.circle(surface, (255, 255, 255), (int(right_eye.x), int(right_eye.y)), eye_radius)
+        self._collect_circle(blit_sequence, (255, 255, 255), (int(left_eye.x), int(left_eye.y)), eye_radius)
+        self._collect_circle(blit_sequence, (255, 255, 255), (int(right_eye.x), int(right_eye.y)), eye_radius)
 
         # Draw pupils with a slight upward offset
         pupil_offset = Vector2(0, -1 * self.scale)
-        pygame.draw.circle(
-            surface, (0, 0, 0), (int(left_eye.x + pupil_offset.x), int(left_eye.y + pupil_offset.y)), pupil_radius
+        self._collect_circle(
+            blit_sequence,
+            (0, 0, 0),
+            (int(left_eye.x + pupil_offset.x), int(left_eye.y + pupil_offset.y)),
+            pupil_radius,
         )
-        pygame.draw.circle(
-            surface, (0, 0, 0), (int(right_eye.x + pupil_offset.x), int(right_eye.y + pupil_offset.y)), pupil_radius
+        self._collect_circle(
+            blit_sequence,
+            (0, 0, 0),
+            (int(right_eye.x + pupil_offset.x), int(right_eye.y + pupil_offset.y)),
+            pupil_radius,
         )
 
     def activate(self) -> None:
@@ -187,9 +361,7 @@ class Snake(Critter):
     def spawn(self) -> None:
         self.alive = True
         self.activate()
-        self.segments = [Vector2(random.randint(0, self.width), random.randint(self.min_y, self.max_y))]
-        self.x = int(self.segments[0].x)
-        self.y = int(self.segments[0].y)
+        self.reset_segments(random.randint(0, self.width), random.randint(self.min_y, self.max_y))
         self.color = self.generate_color()
 
     def despawn(self) -> None: